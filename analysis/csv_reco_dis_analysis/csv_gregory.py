@@ -7,6 +7,8 @@ comparing truth vs reconstructed kinematics.
 
 Usage:
     csv_b2root.py file1.mc_dis.csv file1.reco_dis.csv ... -o /output/directory
+    csv_b2root.py ... -o /output/directory --cache-dir /tmp/csv_cache
+    csv_b2root.py ... -o /output/directory -j 4
 
 The script expects paired CSV files (can be in different directories):
 - *mc_dis.csv: Monte Carlo truth data
@@ -20,14 +22,32 @@ Input CSV format (see docs/data-csv.md):
 """
 
 import argparse
+import hashlib
 import itertools
+import multiprocessing
 import os
+import re
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend for saving plots
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from matplotlib.colors import LogNorm
+from matplotlib.figure import Figure
+
+# Optional: fast-histogram bins regular grids without numpy's edge search
+try:
+    from fast_histogram import histogram1d as fast_histogram1d
+    from fast_histogram import histogram2d as fast_histogram2d
+except ImportError:
+    fast_histogram1d = fast_histogram2d = None
 
 
 # =============================================================================
@@ -39,10 +59,36 @@ TRUTH_VAR_MAPPING = {'x': 'xbj', 'q2': 'q2', 'y': 'y_d', 'w': 'w'}
 KINEMATIC_VARS = list(TRUTH_VAR_MAPPING.keys())
 VAR_LABELS = {'x': r'$x_{bj}$', 'q2': r'$Q^2$', 'y': 'y', 'w': 'W'}
 
+# (var1, var2, truth_col1, truth_col2, label1, label2) for every correlation pair
+KINEMATIC_PAIRS = [
+    (v1, v2, TRUTH_VAR_MAPPING[v1], TRUTH_VAR_MAPPING[v2], VAR_LABELS[v1], VAR_LABELS[v2])
+    for v1, v2 in itertools.combinations(KINEMATIC_VARS, 2)
+]
+
 # Analysis parameters
 AGREEMENT_THRESHOLD = 0.20
 Y_CUT_THRESHOLD = 0.1
 
+# Reco columns are named <method>_<var>; MC columns start with mc_
+RECO_METHOD_PATTERN = re.compile(r'^(?!mc_)([^_]*)_')
+
+# Reco kinematic columns (<method>_x, _q2, _y, _w), the only reco columns the analysis reads
+RECO_KINEMATIC_PATTERN = re.compile(rf"^(?!mc_)[^_]*_(?:{'|'.join(KINEMATIC_VARS)})$")
+
+# Fast zlib level for the PNG plots: much quicker to encode, slightly larger files
+PNG_PIL_KWARGS = {'compress_level': 1}
+
+# Large CSV blocks keep Arrow's parser threads busy on multi-GB files
+CSV_READ_OPTIONS = pv.ReadOptions(block_size=64 << 20, use_threads=True)
+
+# Small blocks for reading just the header line of a CSV file
+CSV_HEADER_READ_OPTIONS = pv.ReadOptions(block_size=1 << 20)
+
+# Version of the loaded-table layout stored in --cache-dir. Bump it whenever the
+# loader changes what it produces (columns, types, event-ID offsets), so caches
+# written by an older loader are not reused.
+CACHE_FORMAT_VERSION = 2
+
 
 # =============================================================================
 # File Handling
@@ -115,79 +161,242 @@ def validate_file_pairs(input_files: list[str]) -> list[tuple[str, str]]:
 # Data Loading
 # =============================================================================
 
-def load_csv_with_unique_events(filepath: str, key_column: str = 'evt',
-                                 offset: int = 0) -> tuple[pd.DataFrame, int]:
-    """Load a CSV file and adjust event IDs to be globally unique."""
-    try:
-        df = pd.read_csv(filepath)
-        df.columns = [col.strip().strip(',') for col in df.columns]
+def csv_column_names(filepath: str) -> list[str]:
+    """Return the column names from the header of a CSV file, as Arrow reads them."""
+    with pv.open_csv(filepath, read_options=CSV_HEADER_READ_OPTIONS) as reader:
+        return reader.schema.names
 
-        if df.empty:
-            return pd.DataFrame(), offset
 
-        if key_column not in df.columns:
-            if 'event' in df.columns and key_column == 'evt':
-                df = df.rename(columns={'event': 'evt'})
+def load_csv_with_unique_events(filepath: str,
+                                 key_column: str = 'evt') -> tuple[pa.Table, int]:
+    """Load a CSV file as an Arrow table together with its largest event ID.
+
+    The caller offsets the event IDs so they are globally unique.
+    Returns (None, None) if the file is empty or cannot be used.
+    """
+    try:
+        # Read only the event key, the truth columns and the reco kinematic
+        # columns, with their types declared up front. Other columns (which may
+        # hold anything) are never parsed, and the streaming reader does not
+        # infer types from the first block only: a reco column that is empty
+        # throughout that block (nothing reconstructed) would otherwise become
+        # the null type and fail on its first later value. Reco columns stay
+        # at full precision until the kinematic cuts have been applied.
+        names = {raw_name: raw_name.strip().strip(',') for raw_name in csv_column_names(filepath)}
+        if key_column not in names.values():
+            if 'event' in names.values() and key_column == 'evt':
+                names = {raw: 'evt' if name == 'event' else name for raw, name in names.items()}
             else:
                 print(f"Warning: Key column '{key_column}' not found in {filepath}")
-                return pd.DataFrame(), offset
+                return None, None
+
+        truth_columns = set(TRUTH_VAR_MAPPING.values())
+        column_types = {}
+        for raw_name, name in names.items():
+            if name == key_column:
+                column_types[raw_name] = pa.int64()
+            elif name in truth_columns:
+                column_types[raw_name] = pa.float32()
+            elif RECO_KINEMATIC_PATTERN.match(name):
+                column_types[raw_name] = pa.float64()
+        convert_options = pv.ConvertOptions(column_types=column_types,
+                                            include_columns=list(column_types))
+
+        # Stream the file block by block; Arrow parses each block with multiple threads
+        reader = pv.open_csv(filepath, read_options=CSV_READ_OPTIONS,
+                             convert_options=convert_options)
+        table = reader.read_all()
+        table = table.rename_columns([names[raw_name] for raw_name in table.column_names])
+
+        if table.num_rows == 0:
+            return None, None
+
+        keys = table[key_column]
+        max_evt = pc.max(keys).as_py()
+
+        return table, max_evt
 
-        df[key_column] = pd.to_numeric(df[key_column], errors="coerce")
-        df[key_column] += offset
+    except Exception as e:
+        print(f"Error reading {filepath}: {e}")
+        return None, None
 
-        max_evt = df[key_column].max()
-        new_offset = int(max_evt) + 1 if pd.notna(max_evt) else offset
 
-        return df, new_offset
+def tables_to_dataframe(tables: list[pa.Table]) -> pd.DataFrame:
+    """Concatenate per-file Arrow tables and convert them to pandas once.
 
-    except Exception as e:
-        print(f"Error reading {filepath}: {e}")
-        return pd.DataFrame(), offset
+    concat_tables only references the per-file buffers, and self_destruct
+    releases them column by column during conversion, so the combined data
+    is not held twice as it was with a list of DataFrames + pd.concat.
+    """
+    if not tables:
+        return pd.DataFrame()
+
+    combined = pa.concat_tables(tables, promote_options='permissive')
+    tables.clear()
+    return combined.to_pandas(split_blocks=True, self_destruct=True)
 
 
 def load_file_pairs(file_pairs: list[tuple[str, str]],
                     key_column: str = 'evt') -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Load and concatenate multiple file pairs."""
-    mc_dfs = []
-    reco_dfs = []
-    mc_offset = 0
-    reco_offset = 0
+    """Load and concatenate multiple file pairs.
+
+    Both files of a pair share one event-ID offset, so MC and reco events
+    still match when one file lacks the highest event IDs of the other.
+    """
+    loaded = {'mc': ([], [], []), 'reco': ([], [], [])}  # tables, offsets, lengths
+    offset = 0
 
     for mc_file, reco_file in sorted(file_pairs):
-        mc_df, mc_offset = load_csv_with_unique_events(mc_file, key_column, mc_offset)
-        reco_df, reco_offset = load_csv_with_unique_events(reco_file, key_column, reco_offset)
+        max_evts = []
+        for kind, filepath in (('mc', mc_file), ('reco', reco_file)):
+            table, max_evt = load_csv_with_unique_events(filepath, key_column)
+            if table is None:
+                continue
+            tables, offsets, lengths = loaded[kind]
+            tables.append(table)
+            offsets.append(offset)
+            lengths.append(table.num_rows)
+            if max_evt is not None:
+                max_evts.append(max_evt)
+
+        if max_evts:
+            offset += int(max(max_evts)) + 1
+
+    dfs = []
+    for tables, offsets, lengths in loaded.values():
+        df = tables_to_dataframe(tables)
+        if not df.empty:
+            # Apply all per-file offsets in one vectorized pass
+            df[key_column] = df[key_column].to_numpy() + np.repeat(offsets, lengths)
+        dfs.append(df)
+
+    return dfs[0], dfs[1]
+
+
+def file_pairs_cache_key(file_pairs: list[tuple[str, str]], key_column: str = 'evt') -> str:
+    """Hash the cache format version, input paths, sizes and modification times into a cache key."""
+    digest = hashlib.sha1(f"v{CACHE_FORMAT_VERSION}:{key_column}".encode())
+    for path in sorted(itertools.chain.from_iterable(file_pairs)):
+        st = os.stat(path)
+        digest.update(f"{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def write_parquet_atomic(df: pd.DataFrame, path: str) -> None:
+    """Write a Parquet file under a temporary name and rename it into place.
+
+    An interrupted run then leaves no truncated file at `path` for the next
+    run to trust. The file gets the usual umask-based permissions, so a cache
+    in a shared directory stays readable by other users.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, compression='zstd')
+        # mkstemp creates the file as 0600; os.umask can only be read by setting it
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def load_file_pairs_cached(file_pairs: list[tuple[str, str]], cache_dir: str = None,
+                           key_column: str = 'evt') -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Load file pairs, reusing Parquet copies of the concatenated tables if present."""
+    if not cache_dir:
+        return load_file_pairs(file_pairs, key_column)
+
+    key = file_pairs_cache_key(file_pairs, key_column)
+    mc_cache = os.path.join(cache_dir, f"{key}.mc_dis.parquet")
+    reco_cache = os.path.join(cache_dir, f"{key}.reco_dis.parquet")
+
+    if os.path.exists(mc_cache) and os.path.exists(reco_cache):
+        print(f"  Using cached tables from {cache_dir} (key {key})")
+        return pd.read_parquet(mc_cache), pd.read_parquet(reco_cache)
+
+    mc_df, reco_df = load_file_pairs(file_pairs, key_column)
+
+    if not mc_df.empty and not reco_df.empty:
+        os.makedirs(cache_dir, exist_ok=True)
+        write_parquet_atomic(mc_df, mc_cache)
+        write_parquet_atomic(reco_df, reco_cache)
+        print(f"  Cached concatenated tables in {cache_dir} (key {key})")
+
+    return mc_df, reco_df
+
+
+def sorted_unique_keys(df: pd.DataFrame, key_column: str, name: str) -> tuple[np.ndarray, np.ndarray]:
+    """Return (order, sorted keys) of a table, raising ValueError on repeated keys."""
+    keys = df[key_column].to_numpy()
+    # Stable sort is near-linear on the already ordered offset event IDs
+    order = np.argsort(keys, kind='stable')
+    keys = keys[order]
+    if np.any(keys[1:] == keys[:-1]):
+        raise ValueError(f"{name} table has repeated '{key_column}' values")
+    return order, keys
+
+
+def merge_on_events(mc_df: pd.DataFrame, reco_df: pd.DataFrame,
+                    key_column: str = 'evt') -> pd.DataFrame:
+    """Inner-join the MC and reco tables on their unique event IDs.
+
+    Matches the sorted key arrays with np.searchsorted and gathers every column
+    once, instead of a pandas hash join. Rows keep the MC table order and
+    overlapping column names get pandas' '_x'/'_y' suffixes, as pd.merge would.
+    Raises ValueError if either table repeats an event ID.
+    """
+    mc_order, mc_keys = sorted_unique_keys(mc_df, key_column, 'MC')
+    reco_order, reco_keys = sorted_unique_keys(reco_df, key_column, 'Reco')
 
-        if not mc_df.empty:
-            mc_dfs.append(mc_df)
-        if not reco_df.empty:
-            reco_dfs.append(reco_df)
+    pos = np.searchsorted(mc_keys, reco_keys)
+    found = pos < len(mc_keys)
+    found[found] = mc_keys[pos[found]] == reco_keys[found]
 
-    mc_combined = pd.concat(mc_dfs, ignore_index=True) if mc_dfs else pd.DataFrame()
-    reco_combined = pd.concat(reco_dfs, ignore_index=True) if reco_dfs else pd.DataFrame()
+    mc_idx = mc_order[pos[found]]
+    reco_idx = reco_order[found]
+    by_mc_row = np.argsort(mc_idx)
+    mc_idx = mc_idx[by_mc_row]
+    reco_idx = reco_idx[by_mc_row]
 
-    return mc_combined, reco_combined
+    overlap = (set(mc_df.columns) & set(reco_df.columns)) - {key_column}
+    merged = {f"{c}_x" if c in overlap else c: mc_df[c].to_numpy()[mc_idx]
+              for c in mc_df.columns}
+    merged.update({f"{c}_y" if c in overlap else c: reco_df[c].to_numpy()[reco_idx]
+                   for c in reco_df.columns if c != key_column})
+    return pd.DataFrame(merged, copy=False)
 
 
 def extract_reco_methods(reco_df: pd.DataFrame) -> list[str]:
     """Extract reconstruction method names from column prefixes."""
-    methods = set()
-    for col in reco_df.columns:
-        if '_' in col and col != 'evt' and not col.startswith('mc_'):
-            methods.add(col.split('_')[0])
-    return sorted(methods)
+    matches = map(RECO_METHOD_PATTERN.match, reco_df.columns)
+    return sorted({match.group(1) for match in matches if match})
 
 
 def apply_kinematic_cuts(df: pd.DataFrame, reco_methods: list[str]) -> pd.DataFrame:
     """Apply global kinematic cuts (0 <= x, y <= 1 for all methods)."""
-    mask = pd.Series(True, index=df.index)
+    cut_cols = [f"{method}_{var}" for method in reco_methods for var in ['x', 'y']
+                if f"{method}_{var}" in df.columns]
+    if not cut_cols:
+        return df
 
-    for method in reco_methods:
-        for var in ['x', 'y']:
-            col = f"{method}_{var}"
-            if col in df.columns:
-                mask &= (df[col] >= 0) & (df[col] <= 1)
+    # One range check over all cut columns at once, reduced per row
+    values = df[cut_cols].to_numpy()
+    mask = ((values >= 0) & (values <= 1)).all(axis=1)
 
-    return df[mask].copy()
+    return df[mask]
+
+
+def downcast_float_columns(df: pd.DataFrame, key_column: str = 'evt') -> pd.DataFrame:
+    """Store float64 columns other than the event key as float32.
+
+    Only call this after the kinematic cuts: float32 rounds values just
+    outside [0, 1] onto the boundary, which would change the selection.
+    """
+    float_cols = [col for col in df.select_dtypes(include='float64').columns if col != key_column]
+    return df.astype({col: np.float32 for col in float_cols})
 
 
 # =============================================================================
@@ -205,76 +414,124 @@ def compute_data_range(arr: np.ndarray, use_percentiles: bool = True) -> tuple[f
     return (lo, hi) if lo != hi else (lo, lo + 1e-6)
 
 
-def save_2d_histogram(x: np.ndarray, y: np.ndarray, xlabel: str, ylabel: str,
-                      title: str, filename: str, output_dir: str,
-                      bins: int = 100, use_percentiles: bool = True,
-                      vmin: float = 1, custom_range: list = None,
-                      annotation: str = None, x_scale: str = 'linear',
-                      y_scale: str = 'linear') -> None:
-    """Create and save a 2D histogram plot."""
-    mask = np.isfinite(x) & np.isfinite(y)
-    if x_scale == 'log':
-        mask &= (x > 0)
-    if y_scale == 'log':
-        mask &= (y > 0)
+def histogram_2d(x: np.ndarray, y: np.ndarray, bins: int,
+                 data_range) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bin x/y on a regular grid, returning (counts, xedges, yedges)."""
+    if fast_histogram2d is None:
+        return np.histogram2d(x, y, bins=bins, range=data_range)
 
-    if not np.any(mask):
-        print(f"Skipping {filename}: no valid data for specified scale.")
-        return
+    (xmin, xmax), (ymin, ymax) = data_range
+    counts = fast_histogram2d(x, y, bins=bins, range=[[xmin, xmax], [ymin, ymax]])
+    return counts, np.linspace(xmin, xmax, bins + 1), np.linspace(ymin, ymax, bins + 1)
 
-    x_filtered = x[mask]
-    y_filtered = y[mask]
 
-    # Need at least a few points to make a meaningful histogram
-    if len(x_filtered) < 10:
-        print(f"Skipping {filename}: too few data points ({len(x_filtered)}).")
-        return
+def histogram_1d(data: np.ndarray, bins: int, data_range) -> tuple[np.ndarray, np.ndarray]:
+    """Bin data on a regular grid, returning (counts, edges)."""
+    if fast_histogram1d is None or data_range is None:
+        return np.histogram(data, bins=bins, range=data_range)
 
-    if custom_range:
-        data_range = custom_range
-    else:
-        data_range = [
-            compute_data_range(x_filtered, use_percentiles),
-            compute_data_range(y_filtered, use_percentiles)
-        ]
+    lo, hi = data_range
+    return fast_histogram1d(data, bins=bins, range=[lo, hi]), np.linspace(lo, hi, bins + 1)
 
-    plt.figure()
-    plt.xscale(x_scale)
-    plt.yscale(y_scale)
 
-    # Use fewer bins if we have sparse data
-    actual_bins = min(bins, max(10, len(x_filtered) // 5))
+# Figure reused by every plot in this process (see plot_figure)
+_plot_figure = None
 
-    try:
-        h, xedges, yedges, im = plt.hist2d(
-            x_filtered, y_filtered, bins=actual_bins, cmap='viridis',
-            range=data_range, norm=LogNorm(vmin=vmin)
-        )
-        plt.colorbar(im, label="Counts")
-    except ValueError:
-        # Fall back to linear scale if LogNorm fails
-        plt.close()
-        plt.figure()
-        plt.xscale(x_scale)
-        plt.yscale(y_scale)
-        h, xedges, yedges, im = plt.hist2d(
-            x_filtered, y_filtered, bins=actual_bins, cmap='viridis',
-            range=data_range
-        )
-        plt.colorbar(im, label="Counts")
 
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    plt.title(title, fontsize=10)
+def plot_figure() -> Figure:
+    """Return this process's plot figure, cleared for the next plot.
+
+    Clearing one Figure is cheaper than creating and closing a pyplot figure
+    (with its canvas and manager) for each of the hundreds of plots. The Agg
+    canvas is attached once so savefig keeps reusing its renderer.
+    """
+    global _plot_figure
+    if _plot_figure is None:
+        _plot_figure = Figure()
+        FigureCanvasAgg(_plot_figure)
+    else:
+        _plot_figure.clear()
+    return _plot_figure
+
+
+def save_2d_histogram(x: np.ndarray, y: np.ndarray, xlabel: str, ylabel: str,
+                      title: str, filename: str, output_dir: str,
+                      bins: int = 100, use_percentiles: bool = True,
+                      vmin: float = 1, custom_range: list = None,
+                      annotation: str = None, x_scale: str = 'linear',
+                      y_scale: str = 'linear', binned: tuple = None,
+                      finite: np.ndarray = None) -> tuple:
+    """Create and save a 2D histogram plot.
+
+    Returns the binning (counts, xedges, yedges, x_positive, y_positive), or
+    None if the plot was skipped. A log-axis twin of the same plot can pass it
+    back as `binned` to skip filtering and re-binning; it is only reused when
+    the log axes would not drop any of the selected points. Callers that
+    already hold the combined finite mask of x and y can pass it as `finite`.
+    """
+    if (binned is not None and (x_scale != 'log' or binned[3])
+            and (y_scale != 'log' or binned[4])):
+        counts, xedges, yedges, x_positive, y_positive = binned
+    else:
+        mask = finite if finite is not None else np.isfinite(x) & np.isfinite(y)
+        if x_scale == 'log':
+            mask = mask & (x > 0)
+        if y_scale == 'log':
+            mask = mask & (y > 0)
+
+        if not np.any(mask):
+            print(f"Skipping {filename}: no valid data for specified scale.")
+            return None
+
+        x_filtered = x[mask]
+        y_filtered = y[mask]
+
+        # Need at least a few points to make a meaningful histogram
+        if len(x_filtered) < 10:
+            print(f"Skipping {filename}: too few data points ({len(x_filtered)}).")
+            return None
+
+        if custom_range:
+            data_range = custom_range
+        else:
+            data_range = [
+                compute_data_range(x_filtered, use_percentiles),
+                compute_data_range(y_filtered, use_percentiles)
+            ]
+
+        # Use fewer bins if we have sparse data
+        actual_bins = min(bins, max(10, len(x_filtered) // 5))
+        counts, xedges, yedges = histogram_2d(x_filtered, y_filtered, actual_bins, data_range)
+        x_positive = x_filtered.min() > 0
+        y_positive = y_filtered.min() > 0
+
+    fig = plot_figure()
+    ax = fig.add_subplot()
+    ax.set_xscale(x_scale)
+    ax.set_yscale(y_scale)
+
+    # LogNorm needs a bin at or above vmin; otherwise fall back to a linear scale.
+    # Passing vmax spares matplotlib an autoscale pass over the masked counts.
+    vmax = counts.max()
+    norm = LogNorm(vmin=vmin, vmax=vmax) if vmax >= vmin else None
+    im = ax.pcolormesh(xedges, yedges, counts.T, cmap='viridis', norm=norm)
+    fig.colorbar(im, ax=ax, label="Counts")
+
+    ax.set_xlim(xedges[0], xedges[-1])
+    ax.set_ylim(yedges[0], yedges[-1])
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title, fontsize=10)
 
     if annotation:
-        plt.text(0.05, 0.95, annotation, transform=plt.gca().transAxes, fontsize=8,
-                 verticalalignment='top',
-                 bbox=dict(boxstyle='round,pad=0.3', fc='white', alpha=0.5))
+        ax.text(0.05, 0.95, annotation, transform=ax.transAxes, fontsize=8,
+                verticalalignment='top',
+                bbox=dict(boxstyle='round,pad=0.3', fc='white', alpha=0.5))
+
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, filename), pil_kwargs=PNG_PIL_KWARGS)
 
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, filename))
-    plt.close()
+    return counts, xedges, yedges, x_positive, y_positive
 
 
 def save_1d_histogram(data: np.ndarray, xlabel: str, ylabel: str,
@@ -287,177 +544,217 @@ def save_1d_histogram(data: np.ndarray, xlabel: str, ylabel: str,
         print(f"Skipping {filename}: no finite data.")
         return
 
-    plt.figure()
-    plt.hist(data[mask], bins=bins, range=plot_range, histtype='stepfilled', color=color)
-    plt.xlabel(xlabel)
-    plt.ylabel(ylabel)
-    plt.title(title, fontsize=10)
+    fig = plot_figure()
+    ax = fig.add_subplot()
+    counts, edges = histogram_1d(data[mask], bins, plot_range)
+    ax.stairs(counts, edges, fill=True, color=color)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel(ylabel)
+    ax.set_title(title, fontsize=10)
 
     if annotation:
-        plt.text(0.05, 0.95, annotation, transform=plt.gca().transAxes, fontsize=8,
-                 verticalalignment='top',
-                 bbox=dict(boxstyle='round,pad=0.3', fc='white', alpha=0.5))
+        ax.text(0.05, 0.95, annotation, transform=ax.transAxes, fontsize=8,
+                verticalalignment='top',
+                bbox=dict(boxstyle='round,pad=0.3', fc='white', alpha=0.5))
 
-    plt.grid(True)
-    plt.tight_layout()
-    plt.savefig(os.path.join(output_dir, filename))
-    plt.close()
+    ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(os.path.join(output_dir, filename), pil_kwargs=PNG_PIL_KWARGS)
 
 
 # =============================================================================
 # Plot Generation Functions
 # =============================================================================
 
-def generate_truth_vs_reco_plots(df: pd.DataFrame, reco_methods: list[str],
-                                  output_dir: str) -> None:
-    """Generate truth vs reconstructed kinematic plots."""
-    print("\n--- Generating Truth vs Reconstructed Plots ---")
+def column_arrays(df: pd.DataFrame, reco_methods: list[str]) -> dict[str, np.ndarray]:
+    """Extract truth and reco kinematic columns once as NumPy arrays."""
+    names = [TRUTH_VAR_MAPPING[v] for v in KINEMATIC_VARS]
+    names += [f"{method}_{v}" for method in reco_methods for v in KINEMATIC_VARS]
+    return {c: df[c].to_numpy(dtype=np.float32) for c in names if c in df.columns}
+
+
+def finite_masks(cols: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Compute the finite-value mask of every column once."""
+    return {c: np.isfinite(arr) for c, arr in cols.items()}
+
+
+def resolution_cache(cols: dict[str, np.ndarray], finite: dict[str, np.ndarray],
+                     reco_methods: list[str]) -> dict[tuple[str, str], tuple[np.ndarray, np.ndarray]]:
+    """Compute the validity mask and (reco - truth) / truth of every (method, var) once.
+
+    Residuals are NaN wherever the mask is False (non-finite values or zero truth).
+    """
+    residuals = {}
+    for var_key in KINEMATIC_VARS:
+        truth_col = TRUTH_VAR_MAPPING[var_key]
+        if truth_col not in cols:
+            continue
 
+        truth = cols[truth_col]
+        nonzero_truth = finite[truth_col] & (truth != 0)
+
+        for method in reco_methods:
+            reco_col = f"{method}_{var_key}"
+            if reco_col not in cols:
+                continue
+
+            valid = nonzero_truth & finite[reco_col]
+            res = np.full_like(truth, np.nan)
+            np.subtract(cols[reco_col], truth, out=res, where=valid)
+            np.divide(res, truth, out=res, where=valid)
+            residuals[(method, var_key)] = (valid, res)
+
+    return residuals
+
+
+def generate_truth_vs_reco_plots(cols: dict[str, np.ndarray], finite: dict[str, np.ndarray],
+                                  residuals: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]],
+                                  reco_methods: list[str], output_dir: str) -> None:
+    """Generate truth vs reconstructed kinematic plots."""
     for var_key in KINEMATIC_VARS:
         truth_col = TRUTH_VAR_MAPPING[var_key]
-        if truth_col not in df.columns:
+        if truth_col not in cols:
             continue
 
+        var_label = VAR_LABELS[var_key]
+        truth_label = f"Truth {var_label}"
+
         for method in reco_methods:
             reco_col = f"{method}_{var_key}"
-            if reco_col not in df.columns:
+            if reco_col not in cols:
                 continue
 
-            var_label = VAR_LABELS[var_key]
-            truth_label = f"Truth {var_label}"
             reco_label = f"Reco {var_label} ({method})"
             title = f"Reco {var_label} vs Truth ({method})"
 
-            mask = df[truth_col].notna() & df[reco_col].notna()
-            annotation = f"Entries: {mask.sum():,}"
+            valid = finite[truth_col] & finite[reco_col]
+            annotation = f"Entries: {np.count_nonzero(valid):,}"
 
-            save_2d_histogram(
-                df[truth_col].values, df[reco_col].values,
+            binned = save_2d_histogram(
+                cols[truth_col], cols[reco_col],
                 truth_label, reco_label, title,
                 f"truth_vs_reco_{var_key}_{method}.png",
-                output_dir, annotation=annotation
+                output_dir, annotation=annotation, finite=valid
             )
 
             if var_key == 'x':
                 save_2d_histogram(
-                    df[truth_col].values, df[reco_col].values,
+                    cols[truth_col], cols[reco_col],
                     truth_label, reco_label, f"{title} (Log x-axis)",
                     f"truth_vs_reco_logx_{var_key}_{method}.png",
-                    output_dir, annotation=annotation, x_scale='log'
+                    output_dir, annotation=annotation, x_scale='log', binned=binned,
+                    finite=valid
                 )
 
 
-def generate_correlation_plots(df: pd.DataFrame, reco_methods: list[str],
-                                output_dir: str) -> None:
-    """Generate intra-kinematic variable correlation plots."""
-    print("\n--- Generating Correlation Plots ---")
+def generate_truth_correlation_plots(cols: dict[str, np.ndarray], finite: dict[str, np.ndarray],
+                                      residuals: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]],
+                                      reco_methods: list[str], output_dir: str) -> None:
+    """Generate intra-kinematic variable correlation plots of the truth values."""
+    for var1, var2, truth_col1, truth_col2, label1, label2 in KINEMATIC_PAIRS:
+        if truth_col1 not in cols or truth_col2 not in cols:
+            continue
 
-    for var1, var2 in itertools.combinations(KINEMATIC_VARS, 2):
-        truth_col1 = TRUTH_VAR_MAPPING[var1]
-        truth_col2 = TRUTH_VAR_MAPPING[var2]
-        label1 = VAR_LABELS[var1]
-        label2 = VAR_LABELS[var2]
+        valid = finite[truth_col1] & finite[truth_col2]
+        title = f"Truth {label1} vs {label2}"
+        annotation = f"Entries: {np.count_nonzero(valid):,}"
 
-        # Truth correlations
-        if truth_col1 in df.columns and truth_col2 in df.columns:
-            mask = df[truth_col1].notna() & df[truth_col2].notna()
-            title = f"Truth {label1} vs {label2}"
-            annotation = f"Entries: {mask.sum():,}"
+        binned = save_2d_histogram(
+            cols[truth_col1], cols[truth_col2],
+            f"Truth {label1}", f"Truth {label2}", title,
+            f"truth_{var1}_vs_{var2}.png",
+            output_dir, annotation=annotation, finite=valid
+        )
 
+        if var1 == 'x':
             save_2d_histogram(
-                df[truth_col1].values, df[truth_col2].values,
-                f"Truth {label1}", f"Truth {label2}", title,
-                f"truth_{var1}_vs_{var2}.png",
-                output_dir, annotation=annotation
+                cols[truth_col1], cols[truth_col2],
+                f"Truth {label1}", f"Truth {label2}", f"{title} (Log x-axis)",
+                f"truth_logx_{var1}_vs_{var2}.png",
+                output_dir, annotation=annotation, x_scale='log', binned=binned,
+                finite=valid
             )
 
-            if var1 == 'x':
-                save_2d_histogram(
-                    df[truth_col1].values, df[truth_col2].values,
-                    f"Truth {label1}", f"Truth {label2}", f"{title} (Log x-axis)",
-                    f"truth_logx_{var1}_vs_{var2}.png",
-                    output_dir, annotation=annotation, x_scale='log'
-                )
 
+def generate_correlation_plots(cols: dict[str, np.ndarray], finite: dict[str, np.ndarray],
+                                residuals: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]],
+                                reco_methods: list[str], output_dir: str) -> None:
+    """Generate intra-kinematic variable correlation plots per reconstruction method."""
+    for var1, var2, _, _, label1, label2 in KINEMATIC_PAIRS:
         # Reco correlations per method
         for method in reco_methods:
             reco_col1 = f"{method}_{var1}"
             reco_col2 = f"{method}_{var2}"
 
-            if reco_col1 not in df.columns or reco_col2 not in df.columns:
+            if reco_col1 not in cols or reco_col2 not in cols:
                 continue
 
             reco_label1 = f"Reco {label1} ({method})"
             reco_label2 = f"Reco {label2} ({method})"
             title = f"Reco {label1} vs {label2} ({method})"
 
-            mask = df[reco_col1].notna() & df[reco_col2].notna()
-            total_events = mask.sum()
+            mask = finite[reco_col1] & finite[reco_col2]
+            total_events = np.count_nonzero(mask)
             annotation = f"Entries: {total_events:,}"
 
             # Add agreement statistics for x-Q2 plots
             if {var1, var2} == {'x', 'q2'} and total_events > 0:
-                df_agree = df[mask]
                 for v in ['x', 'q2']:
-                    truth_v = TRUTH_VAR_MAPPING[v]
-                    reco_v = f"{method}_{v}"
-                    if truth_v in df_agree.columns:
-                        res = (df_agree[reco_v] - df_agree[truth_v]) / df_agree[truth_v]
-                        agree_count = (abs(res) < AGREEMENT_THRESHOLD).sum()
+                    if (method, v) in residuals:
+                        # Invalid residuals are NaN and never count as agreeing
+                        res = residuals[(method, v)][1][mask]
+                        agree_count = np.count_nonzero(np.abs(res, out=res) < AGREEMENT_THRESHOLD)
                         pct = (agree_count / total_events) * 100
                         v_label = 'x' if v == 'x' else 'Q²'
                         annotation += f"\n{v_label} agree (±{AGREEMENT_THRESHOLD:.0%}): {pct:.1f}%"
 
-            save_2d_histogram(
-                df[reco_col1].values, df[reco_col2].values,
+            binned = save_2d_histogram(
+                cols[reco_col1], cols[reco_col2],
                 reco_label1, reco_label2, title,
                 f"reco_{var1}_vs_{var2}_{method}.png",
-                output_dir, annotation=annotation
+                output_dir, annotation=annotation, finite=mask
             )
 
             if var1 == 'x':
                 save_2d_histogram(
-                    df[reco_col1].values, df[reco_col2].values,
+                    cols[reco_col1], cols[reco_col2],
                     reco_label1, reco_label2, f"{title} (Log x-axis)",
                     f"reco_logx_{var1}_vs_{var2}_{method}.png",
-                    output_dir, annotation=annotation, x_scale='log'
+                    output_dir, annotation=annotation, x_scale='log', binned=binned,
+                    finite=mask
                 )
 
 
-def generate_resolution_plots(df: pd.DataFrame, reco_methods: list[str],
-                               output_dir: str) -> None:
+def generate_resolution_plots(cols: dict[str, np.ndarray], finite: dict[str, np.ndarray],
+                               residuals: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]],
+                               reco_methods: list[str], output_dir: str) -> None:
     """Generate resolution histograms (1D and 2D)."""
-    print("\n--- Generating Resolution Plots ---")
-
     for var_key in KINEMATIC_VARS:
         truth_col = TRUTH_VAR_MAPPING[var_key]
-        if truth_col not in df.columns:
+        if truth_col not in cols:
             continue
 
+        var_label = VAR_LABELS[var_key]
+        truth_label = f"Truth {var_label}"
+        reco_label = f"Reco {var_label}"
+        res_label = f"({reco_label} - {truth_label}) / {truth_label}"
+
         for method in reco_methods:
             reco_col = f"{method}_{var_key}"
-            if reco_col not in df.columns:
+            if reco_col not in cols:
                 continue
 
-            mask = (np.isfinite(df[truth_col]) &
-                    np.isfinite(df[reco_col]) &
-                    (df[truth_col] != 0))
+            mask, res = residuals[(method, var_key)]
 
             if not mask.any():
                 continue
 
-            truth_vals = df.loc[mask, truth_col]
-            reco_vals = df.loc[mask, reco_col]
-            resolution = (reco_vals - truth_vals) / truth_vals
-
-            var_label = VAR_LABELS[var_key]
-            truth_label = f"Truth {var_label}"
-            reco_label = f"Reco {var_label}"
-            res_label = f"({reco_label} - {truth_label}) / {truth_label}"
+            truth_vals = cols[truth_col][mask]
+            resolution = res[mask]
 
             # 1D resolution histogram
             save_1d_histogram(
-                resolution.values, res_label, "Counts",
+                resolution, res_label, "Counts",
                 f"{res_label} ({method})",
                 f"{var_key}_resolution_hist_{method}.png",
                 output_dir, plot_range=(-1, 1),
@@ -465,8 +762,8 @@ def generate_resolution_plots(df: pd.DataFrame, reco_methods: list[str],
             )
 
             # 2D resolution vs truth
-            save_2d_histogram(
-                truth_vals.values, resolution.values,
+            binned = save_2d_histogram(
+                truth_vals, resolution,
                 truth_label, res_label,
                 f"Resolution vs Truth ({method})",
                 f"{var_key}_res_vs_truth_{method}.png",
@@ -475,20 +772,23 @@ def generate_resolution_plots(df: pd.DataFrame, reco_methods: list[str],
 
             if var_key == 'x':
                 save_2d_histogram(
-                    truth_vals.values, resolution.values,
+                    truth_vals, resolution,
                     truth_label, res_label,
                     f"Resolution vs Truth ({method}) (Log x-axis)",
                     f"{var_key}_res_vs_truth_logx_{method}.png",
                     output_dir, annotation=f"Entries: {len(resolution):,}",
-                    x_scale='log'
+                    x_scale='log', binned=binned
                 )
 
 
-def generate_y_cut_plots(df: pd.DataFrame, reco_methods: list[str],
-                          output_dir: str) -> None:
-    """Generate resolution plots with y-cuts."""
-    print("\n--- Generating Y-Cut Resolution Plots ---")
+def generate_y_cut_plots(cols: dict[str, np.ndarray], finite: dict[str, np.ndarray],
+                          residuals: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]],
+                          reco_methods: list[str], output_dir: str) -> None:
+    """Generate resolution plots with y-cuts.
 
+    Expects columns that already passed apply_kinematic_cuts, so every
+    method's x and y lie in [0, 1] and only the y threshold is applied here.
+    """
     y_regions = {
         'low_y': {'threshold': lambda y: y <= Y_CUT_THRESHOLD,
                   'label': f'y <= {Y_CUT_THRESHOLD}'},
@@ -498,39 +798,31 @@ def generate_y_cut_plots(df: pd.DataFrame, reco_methods: list[str],
 
     for method in reco_methods:
         reco_y_col = f"{method}_y"
-        if reco_y_col not in df.columns:
+        if reco_y_col not in cols:
             continue
 
-        method_mask = pd.Series(True, index=df.index)
-        for var in ['x', 'y']:
-            col = f"{method}_{var}"
-            if col in df.columns:
-                method_mask &= (df[col] >= 0) & (df[col] <= 1)
-
         for region_name, region_info in y_regions.items():
-            region_mask = method_mask & region_info['threshold'](df[reco_y_col])
-            df_region = df[region_mask]
+            # Row indices of the region; per-variable selections index only these
+            region_idx = np.flatnonzero(region_info['threshold'](cols[reco_y_col]))
 
-            if df_region.empty:
+            if not region_idx.size:
                 continue
 
             for var_key in ['x', 'q2']:
                 truth_col = TRUTH_VAR_MAPPING[var_key]
                 reco_col = f"{method}_{var_key}"
 
-                if truth_col not in df_region.columns or reco_col not in df_region.columns:
+                if truth_col not in cols or reco_col not in cols:
                     continue
 
-                mask = (np.isfinite(df_region[truth_col]) &
-                        np.isfinite(df_region[reco_col]) &
-                        (df_region[truth_col] != 0))
+                valid, res = residuals[(method, var_key)]
+                idx = region_idx[valid[region_idx]]
 
-                if not mask.any():
+                if not idx.size:
                     continue
 
-                truth_vals = df_region.loc[mask, truth_col]
-                reco_vals = df_region.loc[mask, reco_col]
-                resolution = (reco_vals - truth_vals) / truth_vals
+                truth_vals = cols[truth_col][idx]
+                resolution = res[idx]
 
                 var_label = VAR_LABELS[var_key]
                 truth_label = f"Truth {var_label}"
@@ -538,8 +830,8 @@ def generate_y_cut_plots(df: pd.DataFrame, reco_methods: list[str],
                 title = f"{var_label} Resolution vs Truth\n(Cut: {region_info['label']}, {method})"
                 annotation = f"Entries: {len(resolution):,}"
 
-                save_2d_histogram(
-                    truth_vals.values, resolution.values,
+                binned = save_2d_histogram(
+                    truth_vals, resolution,
                     truth_label, res_label, title,
                     f"res_vs_truth_{var_key}_{region_name}_{method}.png",
                     output_dir, annotation=annotation
@@ -547,53 +839,128 @@ def generate_y_cut_plots(df: pd.DataFrame, reco_methods: list[str],
 
                 if var_key == 'x':
                     save_2d_histogram(
-                        truth_vals.values, resolution.values,
+                        truth_vals, resolution,
                         truth_label, res_label, f"{title}\n(Log x-axis)",
                         f"res_vs_truth_logx_{var_key}_{region_name}_{method}.png",
-                        output_dir, annotation=annotation, x_scale='log'
+                        output_dir, annotation=annotation, x_scale='log', binned=binned
                     )
 
 
-def generate_limited_range_plots(df: pd.DataFrame, reco_methods: list[str],
-                                  output_dir: str) -> None:
+def generate_limited_range_plots(cols: dict[str, np.ndarray], finite: dict[str, np.ndarray],
+                                  residuals: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]],
+                                  reco_methods: list[str], output_dir: str) -> None:
     """Generate plots with limited kinematic ranges."""
-    print("\n--- Generating Limited Range Plots ---")
-
     range_limits = {'x': [0, 1], 'q2': [0, 600], 'y': [0, 1]}
 
     for var_key, limits in range_limits.items():
         truth_col = TRUTH_VAR_MAPPING[var_key]
-        if truth_col not in df.columns:
+        if truth_col not in cols:
             continue
 
+        var_label = VAR_LABELS[var_key]
+        truth_label = f"Truth {var_label}"
+
         for method in reco_methods:
             reco_col = f"{method}_{var_key}"
-            if reco_col not in df.columns:
+            if reco_col not in cols:
                 continue
 
-            var_label = VAR_LABELS[var_key]
-            truth_label = f"Truth {var_label}"
             reco_label = f"Reco {var_label} ({method})"
             title = f"{reco_label} vs {truth_label} [LIMITED RANGE]"
 
-            mask = ((df[truth_col] >= limits[0]) & (df[truth_col] <= limits[1]) &
-                    (df[reco_col] >= limits[0]) & (df[reco_col] <= limits[1]))
-            annotation = f"Entries in Range: {mask.sum():,}"
+            truth_vals = cols[truth_col]
+            reco_vals = cols[reco_col]
+            mask = ((truth_vals >= limits[0]) & (truth_vals <= limits[1]) &
+                    (reco_vals >= limits[0]) & (reco_vals <= limits[1]))
+            annotation = f"Entries in Range: {np.count_nonzero(mask):,}"
 
             save_2d_histogram(
-                df[truth_col].values, df[reco_col].values,
+                truth_vals, reco_vals,
                 truth_label, reco_label, title,
                 f"limited_truth_vs_reco_{var_key}_{method}.png",
                 output_dir, annotation=annotation,
-                custom_range=[limits, limits]
+                custom_range=[limits, limits], finite=finite[truth_col] & finite[reco_col]
             )
 
 
+# (section title, generator) in output order
+PLOT_GENERATORS = [
+    ('Truth vs Reconstructed Plots', generate_truth_vs_reco_plots),
+    ('Truth Correlation Plots', generate_truth_correlation_plots),
+    ('Correlation Plots', generate_correlation_plots),
+    ('Resolution Plots', generate_resolution_plots),
+    ('Y-Cut Resolution Plots', generate_y_cut_plots),
+    ('Limited Range Plots', generate_limited_range_plots),
+]
+
+# Generators that only plot truth values; all others run once per reco method
+TRUTH_ONLY_GENERATORS = {generate_truth_correlation_plots}
+
+# Plot inputs held by each worker process (see run_plot_generators)
+_worker_inputs = {}
+
+
+def _init_plot_worker(cols, finite, residuals, output_dir) -> None:
+    """Store the shared plot inputs in a worker process."""
+    _worker_inputs.update(cols=cols, finite=finite, residuals=residuals, output_dir=output_dir)
+
+
+def _run_plot_generator(task) -> None:
+    """Run one (generator, reco methods) task on the worker's shared inputs."""
+    generate, reco_methods = task
+    generate(_worker_inputs['cols'], _worker_inputs['finite'], _worker_inputs['residuals'],
+             reco_methods, _worker_inputs['output_dir'])
+
+
+def run_plot_generators(cols: dict[str, np.ndarray], finite: dict[str, np.ndarray],
+                        residuals: dict[tuple[str, str], tuple[np.ndarray, np.ndarray]],
+                        reco_methods: list[str], output_dir: str, jobs: int = 1) -> None:
+    """Run all plot generators, in parallel worker processes if jobs > 1.
+
+    jobs=0 uses one worker per CPU core.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    if jobs <= 1:
+        for title, generate in PLOT_GENERATORS:
+            print(f"\n--- Generating {title} ---")
+            generate(cols, finite, residuals, reco_methods, output_dir)
+        return
+
+    # One task per generator and reco method keeps all workers busy
+    sections = []
+    for title, generate in PLOT_GENERATORS:
+        if generate in TRUTH_ONLY_GENERATORS:
+            tasks = [(generate, reco_methods)]
+        else:
+            tasks = [(generate, [method]) for method in reco_methods]
+        sections.append((title, tasks))
+    n_tasks = sum(len(tasks) for _, tasks in sections)
+
+    # Arrow's CSV reader has started native threads by now, and forking a
+    # multithreaded process is unsafe, so workers come from a forkserver (or
+    # are spawned where there is none). The initializer arguments are pickled
+    # once per worker, not once per task.
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    with ProcessPoolExecutor(max_workers=min(jobs, n_tasks),
+                             mp_context=multiprocessing.get_context(start_method),
+                             initializer=_init_plot_worker,
+                             initargs=(cols, finite, residuals, output_dir)) as executor:
+        futures = [(title, [executor.submit(_run_plot_generator, task) for task in tasks])
+                   for title, tasks in sections]
+        # Section headers are printed once, here, in the same order as the serial run
+        for title, section_futures in futures:
+            print(f"\n--- Generating {title} ---")
+            for future in section_futures:
+                future.result()
+
+
 # =============================================================================
 # Main Analysis Pipeline
 # =============================================================================
 
-def run_analysis(file_pairs: list[tuple[str, str]], output_dir: str) -> None:
+def run_analysis(file_pairs: list[tuple[str, str]], output_dir: str,
+                 cache_dir: str = None, jobs: int = 1) -> None:
     """Run full analysis pipeline."""
     print(f"\n{'='*60}")
     print(f"Running EIC Data Analysis")
@@ -603,40 +970,50 @@ def run_analysis(file_pairs: list[tuple[str, str]], output_dir: str) -> None:
 
     # Load data
     print("\n--- Loading CSV Data ---")
-    mc_df, reco_df = load_file_pairs(file_pairs)
+    mc_df, reco_df = load_file_pairs_cached(file_pairs, cache_dir)
 
     if mc_df.empty or reco_df.empty:
         print("Error: A required dataframe is empty.")
         return
 
-    # Merge datasets
-    merged_df = pd.merge(mc_df, reco_df, on='evt', how='inner')
-    if merged_df.empty:
-        print("Error: Merged DataFrame is empty.")
-        return
-
-    print(f"  Loaded {len(merged_df)} merged events")
-
     # Extract reconstruction methods
     reco_methods = extract_reco_methods(reco_df)
     print(f"  Found reconstruction methods: {reco_methods}")
 
-    # Apply kinematic cuts
+    # Apply kinematic cuts before merging: every cut column is a reco column,
+    # so events that fail them never enter the join
     print("\n--- Applying Kinematic Cuts ---")
-    initial_rows = len(merged_df)
-    merged_df = apply_kinematic_cuts(merged_df, reco_methods)
-    print(f"  Kept {len(merged_df)} of {initial_rows} events after cuts.")
+    initial_rows = len(reco_df)
+    reco_df = apply_kinematic_cuts(reco_df, reco_methods)
+    print(f"  Kept {len(reco_df)} of {initial_rows} reco events after cuts.")
 
-    if merged_df.empty:
+    if reco_df.empty:
         print("DataFrame empty after cuts. Skipping all plots.")
         return
 
+    # Only binning and plotting follow, so single precision is enough
+    mc_df = downcast_float_columns(mc_df)
+    reco_df = downcast_float_columns(reco_df)
+
+    # Merge datasets (both tables hold one row per event)
+    try:
+        merged_df = merge_on_events(mc_df, reco_df)
+    except ValueError as e:
+        print(f"Error: Event IDs are not unique across the loaded tables: {e}")
+        return
+    if merged_df.empty:
+        print("Error: Merged DataFrame is empty.")
+        return
+
+    print(f"  Loaded {len(merged_df)} merged events")
+
+    # Column arrays, finite masks and residuals are shared by all plot generators
+    cols = column_arrays(merged_df, reco_methods)
+    finite = finite_masks(cols)
+    residuals = resolution_cache(cols, finite, reco_methods)
+
     # Generate all plots
-    generate_truth_vs_reco_plots(merged_df, reco_methods, output_dir)
-    generate_correlation_plots(merged_df, reco_methods, output_dir)
-    generate_resolution_plots(merged_df, reco_methods, output_dir)
-    generate_y_cut_plots(merged_df, reco_methods, output_dir)
-    generate_limited_range_plots(merged_df, reco_methods, output_dir)
+    run_plot_generators(cols, finite, residuals, reco_methods, output_dir, jobs)
 
     print(f"\nAnalysis complete. Plots saved to: {output_dir}")
 
@@ -665,6 +1042,10 @@ Notes:
     - Files are paired by base name: foo.mc_dis.csv <-> foo.reco_dis.csv
     - Both mc_dis.csv and reco_dis.csv must be provided for each dataset
     - All plots are saved as PNG files in the output directory
+    - With --cache-dir, the concatenated tables are stored as Parquet and
+      reused on the next run with the same (unchanged) input files
+    - With -j N, the plots are split per section and reco method across
+      N worker processes (-j 0 uses all CPU cores)
         """
     )
 
@@ -682,6 +1063,21 @@ Notes:
         help='Output directory for plot files'
     )
 
+    parser.add_argument(
+        '--cache-dir',
+        default=None,
+        metavar='DIR',
+        help='Directory for Parquet caches of the loaded CSV tables (disabled by default)'
+    )
+
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        metavar='N',
+        help='Number of worker processes for plot generation, 0 for all cores (default: 1)'
+    )
+
     return parser.parse_args()
 
 
@@ -700,7 +1096,7 @@ def main():
     print(f"Found {len(file_pairs)} valid file pair(s).")
 
     # Run analysis
-    run_analysis(file_pairs, args.output)
+    run_analysis(file_pairs, args.output, args.cache_dir, args.jobs)
 
     print("\n\nAll processing finished.")
 
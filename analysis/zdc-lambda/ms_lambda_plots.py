@@ -40,6 +40,10 @@ def gauss(x, A, mu, sigma):
     return A * np.exp(-0.5 * ((x - mu)/sigma)**2)
 
 
+# Compiled once; matches labels like '_5x41_' (see extract_beam_energy)
+BEAM_ENERGY_PATTERN = re.compile(r'_(\d+x\d+)_')
+
+
 def extract_beam_energy(filename):
     """
     Attempt to parse a beam-energy label (e.g. '5x41', '10x100', '18x275')
@@ -48,7 +52,7 @@ def extract_beam_energy(filename):
     # Example filenames: k_lambda_5x41_5000evt_200.edm4eic.root
     #                   k_lambda_10x100_5000evt_001.edm4eic.root
     # We look for a pattern like: '_5x41_' or '_10x100_' or '_18x275_' ...
-    match = re.search(r'_(\d+x\d+)_', filename)
+    match = BEAM_ENERGY_PATTERN.search(filename)
     if match:
         return match.group(1)  # e.g. "5x41"
     return "unknownBeam"
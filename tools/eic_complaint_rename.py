@@ -3,18 +3,27 @@ import re
 
 is_test_run = True
 
+# YYYY-MM-DD dates, rewritten as DD-MM-YYYY
+date_pattern = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+
 def rename_files_in_directory(directory):
-    for filename in os.listdir(directory):
-        if filename.endswith('.txt'):
-            new_filename = re.sub(r'(\d{4})-(\d{2})-(\d{2})', r'\3-\2-\1', filename)
+    # Collect the renames first, so the directory is not modified while it is being scanned
+    renames = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            filename = entry.name
+            if not (filename.endswith('.txt') and entry.is_file()):
+                continue
+            new_filename = date_pattern.sub(r'\3-\2-\1', filename)
             if new_filename != filename:
-                old_file_path = os.path.join(directory, filename)
-                new_file_path = os.path.join(directory, new_filename)
-                if is_test_run:
-                    print(f"Would rename: {old_file_path} to {new_file_path}")
-                else:
-                    os.rename(old_file_path, new_file_path)
-                    print(f"Renamed: {old_file_path} to {new_file_path}")
+                renames.append((entry.path, os.path.join(directory, new_filename)))
+
+    for old_file_path, new_file_path in renames:
+        if is_test_run:
+            print(f"Would rename: {old_file_path} to {new_file_path}")
+        else:
+            os.rename(old_file_path, new_file_path)
+            print(f"Renamed: {old_file_path} to {new_file_path}")
 
 if __name__ == "__main__":
     target_directory = 'path/to/your/directory'  # Change this to your target directory
@@ -3,15 +3,25 @@ import os
 import re
 import sys
 
+# <prefix>_<number>.<ext>, with the number zero-padded to 4 digits
+number_pattern = re.compile(r'^(.+_)(\d+)(\..+)$')
+
 directory = sys.argv[1]
 
-for filename in os.listdir(directory):
-    match = re.match(r'^(.+_)(\d+)(\..+)$', filename)
-    if match:
-        prefix, number, ext = match.groups()
-        new_name = f"{prefix}{int(number):04d}{ext}"
-        if filename != new_name:
-            old_path = os.path.join(directory, filename)
-            new_path = os.path.join(directory, new_name)
-            print(f"{filename} -> {new_name}")
-            os.rename(old_path, new_path)
+# Collect the renames first, so the directory is not modified while it is being scanned
+renames = []
+with os.scandir(directory) as entries:
+    for entry in entries:
+        filename = entry.name
+        match = number_pattern.match(filename)
+        if match:
+            prefix, number, ext = match.groups()
+            new_name = f"{prefix}{int(number):04d}{ext}"
+            if filename != new_name:
+                renames.append((filename, new_name))
+
+for filename, new_name in renames:
+    old_path = os.path.join(directory, filename)
+    new_path = os.path.join(directory, new_name)
+    print(f"{filename} -> {new_name}")
+    os.rename(old_path, new_path)
@@ -11,9 +11,38 @@ Example:
 
 import argparse
 import sys
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+import matplotlib
+matplotlib.use('Agg')  # Use non-interactive backend for saving plots
 import matplotlib.pyplot as plt
 import matplotlib.colors as mcolors
+from matplotlib.lines import Line2D
+
+# Columns used by the plot and the dtypes to parse them as
+HIT_COLUMNS = {
+    'evt': 'int64',
+    'prt_status': 'int32',
+    'trk_hit_time': 'float32',
+    'trk_hit_pos_z': 'float32',
+}
+
+# Tableau colors for statuses other than 1, without tab:red (red is reserved for status 1)
+NON_RED_COLORS = tuple(c for c in mcolors.TABLEAU_COLORS.values() if c != '#d62728')
+
+# RGBA table of tab20, used once the Tableau colors run out
+TAB20_COLORS = plt.cm.tab20(np.arange(20))
+
+
+def read_hits_csv(csv_file: str) -> pd.DataFrame:
+    """Read only the plotted columns with pyarrow's multithreaded CSV reader."""
+    convert_options = pv.ConvertOptions(
+        column_types={name: pa.type_for_alias(dtype) for name, dtype in HIT_COLUMNS.items()},
+        include_columns=list(HIT_COLUMNS),
+    )
+    return pv.read_csv(csv_file, convert_options=convert_options).to_pandas()
 
 
 def create_time_vs_z_plot(df: pd.DataFrame, event_num: int, output_file: str):
@@ -26,11 +55,11 @@ def create_time_vs_z_plot(df: pd.DataFrame, event_num: int, output_file: str):
         output_file: Output file path for the plot
     """
     # Filter data for the specified event
-    event_df = df[df['evt'] == event_num].copy()
+    event_df = df[df['evt'] == event_num]
 
     if event_df.empty:
         print(f"Error: No data found for event {event_num}")
-        print(f"Available events: {sorted(df['evt'].unique())[:20]}...")
+        print(f"Available events: {df['evt'].drop_duplicates().nsmallest(20).tolist()}...")
         sys.exit(1)
 
     print(f"Event {event_num}: {len(event_df)} hits")
@@ -41,39 +70,44 @@ def create_time_vs_z_plot(df: pd.DataFrame, event_num: int, output_file: str):
 
     # Define color map - status 1 must be red
     # Use a qualitative colormap for other statuses
-    base_colors = list(mcolors.TABLEAU_COLORS.values())
     color_map = {}
 
     color_idx = 0
     for status in status_values:
         if status == 1:
             color_map[status] = 'red'
+        elif color_idx < len(NON_RED_COLORS):
+            color_map[status] = NON_RED_COLORS[color_idx]
+            color_idx += 1
         else:
-            # Skip red-like colors for other statuses
-            while color_idx < len(base_colors) and base_colors[color_idx] in ['#d62728', 'red']:
-                color_idx += 1
-            if color_idx < len(base_colors):
-                color_map[status] = base_colors[color_idx]
-                color_idx += 1
-            else:
-                # Fallback to generating colors
-                color_map[status] = plt.cm.tab20(len(color_map) / 20)
+            # Fallback to tab20 colors (indices past the end clip to the last color)
+            color_map[status] = tuple(TAB20_COLORS[min(len(color_map), len(TAB20_COLORS) - 1)])
 
     # Create figure
     fig, ax = plt.subplots(figsize=(12, 8))
 
-    # Plot each status group
-    for status in status_values:
-        status_df = event_df[event_df['prt_status'] == status]
-        ax.scatter(
-            status_df['trk_hit_time'],
-            status_df['trk_hit_pos_z'],
-            c=color_map[status],
-            label=f'prt_status={status} ({len(status_df)} hits)',
-            alpha=0.7,
-            s=20,
-            edgecolors='none'
-        )
+    # Plot all hits in one scatter call, coloured per hit by its status
+    # (status_values is sorted, so searchsorted maps each hit to its status index)
+    status_idx = np.searchsorted(status_values, event_df['prt_status'].to_numpy())
+    palette = mcolors.to_rgba_array([color_map[status] for status in status_values])
+    hit_time = event_df['trk_hit_time'].to_numpy()
+    ax.scatter(
+        hit_time,
+        event_df['trk_hit_pos_z'],
+        c=palette[status_idx],
+        alpha=0.7,
+        s=20,
+        edgecolors='none'
+    )
+
+    # Legend entries for each status group
+    status_counts = np.bincount(status_idx, minlength=len(status_values))
+    legend_handles = [
+        Line2D([], [], linestyle='none', marker='o', markersize=np.sqrt(20),
+               markerfacecolor=color_map[status], markeredgecolor='none', alpha=0.7,
+               label=f'prt_status={status} ({count} hits)')
+        for status, count in zip(status_values, status_counts)
+    ]
 
     # Configure axes
     ax.set_xlim(0, 2000)
@@ -85,7 +119,7 @@ def create_time_vs_z_plot(df: pd.DataFrame, event_num: int, output_file: str):
     ax.grid(True, linestyle='--', alpha=0.5)
 
     # Add legend
-    ax.legend(loc='best', fontsize=10)
+    ax.legend(handles=legend_handles, loc='best', fontsize=10)
 
     # Tight layout
     plt.tight_layout()
@@ -101,7 +135,7 @@ def create_time_vs_z_plot(df: pd.DataFrame, event_num: int, output_file: str):
     else:
         full_range_file = f"{output_file}_full_range"
 
-    ax.set_xlim(event_df['trk_hit_time'].min() - 10, event_df['trk_hit_time'].max() + 10)
+    ax.set_xlim(hit_time.min() - 10, hit_time.max() + 10)
     ax.set_title(f'Tracker Hits: Time vs Z Position (Event {event_num}) - Full Range', fontsize=14)
     plt.savefig(full_range_file, dpi=150, bbox_inches='tight')
     print(f"Full range plot saved to: {full_range_file}")
@@ -129,7 +163,7 @@ def main():
     # Read CSV file
     print(f"Reading {args.csv_file}...")
     try:
-        df = pd.read_csv(args.csv_file)
+        df = read_hits_csv(args.csv_file)
     except FileNotFoundError:
         print(f"Error: File not found: {args.csv_file}")
         sys.exit(1)
@@ -37,6 +37,8 @@ Requirements:
 """
 
 import sys
+import awkward as ak
+import numpy as np
 import uproot
 
 
@@ -150,9 +152,12 @@ def main():
                 pos_y_branch = f'{branch_name}/{branch_name}.position.y'
 
                 # Verify these branches exist before trying to read them
-                if pos_x_branch not in tree.keys() or pos_y_branch not in tree.keys():
+                # (tree.keys() walks the branch metadata, so list it only once)
+                tree_keys = tree.keys()
+                available_keys = set(tree_keys)
+                if pos_x_branch not in available_keys or pos_y_branch not in available_keys:
                     print(f"Error: Position branches not found for {branch_name}")
-                    print(f"Available sub-branches: {[k for k in tree.keys() if k.startswith(branch_name)]}")
+                    print(f"Available sub-branches: {[k for k in tree_keys if k.startswith(branch_name)]}")
                     sys.exit(1)
 
                 # =============================================================
@@ -167,8 +172,10 @@ def main():
 
                 print(f"\nReading position data for first {max_entries} events...")
 
-                pos_x_array = tree[pos_x_branch].array(entry_stop=max_entries)
-                pos_y_array = tree[pos_y_branch].array(entry_stop=max_entries)
+                # Read both branches in one call so uproot fetches them together
+                arrays = tree.arrays([pos_x_branch, pos_y_branch], entry_stop=max_entries, how=dict)
+                pos_x_array = arrays[pos_x_branch]
+                pos_y_array = arrays[pos_y_branch]
 
                 # These are awkward arrays - they handle jagged data efficiently
                 print(f"Data type: {type(pos_x_array)}")
@@ -181,39 +188,44 @@ def main():
                 # =============================================================
                 # STEP 10: Process and Display the Hit Data
                 # =============================================================
-                # We'll iterate through events and hits, displaying positions
-
-                total_hit_count = 0  # Track the total number of hits displayed
-                entry_idx = -1       # The last event number processed
-
-                for entry_idx in range(len(pos_x_array)):
-                    # Get hits for this specific event
-                    event_pos_x = pos_x_array[entry_idx]
-                    event_pos_y = pos_y_array[entry_idx]
-
-                    # Only process events that actually have hits
-                    if len(event_pos_x) > 0:
-                        print(f"\nEvent {entry_idx}: {len(event_pos_x)} hits")
-
-                        # Loop through each hit in this event
-                        for hit_idx in range(len(event_pos_x)):
-                            # Stop if we've displayed 100 hits total
-                            if total_hit_count >= 100:
-                                print(f"\n... (stopped at 100 hits total)")
-                                break
-
-                            # Extract x,y coordinates for this hit
-                            x = event_pos_x[hit_idx]
-                            y = event_pos_y[hit_idx]
-
-                            # Display with formatting for readability
-                            # Position units are typically in mm in EDM4hep
-                            print(f"  Hit {hit_idx:3d}: x = {x:12.6f} mm, y = {y:12.6f} mm")
-                            total_hit_count += 1
-
-                    # Stop processing events if we've shown enough hits
-                    if total_hit_count >= 100:
-                        break
+                # Instead of indexing the awkward arrays hit by hit, we use the
+                # number of hits per event to find how many events hold the
+                # first 100 hits, then flatten just those events into NumPy
+                # arrays in one call
+
+                max_hits = 100
+                hit_counts = ak.to_numpy(ak.num(pos_x_array))
+                cumulative_hits = np.cumsum(hit_counts)
+                events_needed = min(int(np.searchsorted(cumulative_hits, max_hits)) + 1, len(hit_counts))
+
+                flat_x = ak.to_numpy(ak.flatten(pos_x_array[:events_needed]))[:max_hits]
+                flat_y = ak.to_numpy(ak.flatten(pos_y_array[:events_needed]))[:max_hits]
+
+                total_hit_count = len(flat_x)  # Track the total number of hits displayed
+                entry_idx = events_needed - 1  # The last event number processed
+
+                # Only events that actually have hits are displayed.
+                # The lines are collected and printed in one go at the end
+                lines = []
+                hit_start = 0
+                for event_idx in np.flatnonzero(hit_counts[:events_needed]):
+                    event_hits = hit_counts[event_idx]
+                    lines.append(f"\nEvent {event_idx}: {event_hits} hits")
+
+                    # Slice this event's hits out of the flat arrays
+                    hit_stop = min(hit_start + event_hits, total_hit_count)
+                    for hit_idx, (x, y) in enumerate(zip(flat_x[hit_start:hit_stop], flat_y[hit_start:hit_stop])):
+                        # Display with formatting for readability
+                        # Position units are typically in mm in EDM4hep
+                        lines.append(f"  Hit {hit_idx:3d}: x = {x:12.6f} mm, y = {y:12.6f} mm")
+
+                    # The event still had hits left when we reached the limit
+                    if hit_stop - hit_start < event_hits:
+                        lines.append(f"\n... (stopped at {max_hits} hits total)")
+                    hit_start = hit_stop
+
+                if lines:
+                    print("\n".join(lines))
 
                 # =============================================================
                 # STEP 11: Summary Statistics